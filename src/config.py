@@ -47,7 +47,9 @@ MEETING_TIME = time(hour=21, minute=15)
 # ┌───────────────────────────────────────────────────────────────────────────┐
 # │                        Monte Carlo Parameters                             │
 # └───────────────────────────────────────────────────────────────────────────┘
-MONTE_CARLO_ITERATIONS = 200_000
+MONTE_CARLO_ITERATIONS = 200_000  # Maximum samples per departure
+MONTE_CARLO_BATCH_SIZE = 8192  # Samples drawn per batch
+MONTE_CARLO_CI_HALF_WIDTH = 0.005  # Stop once the 95% CI on P(late) is ±this
 
 # ┌───────────────────────────────────────────────────────────────────────────┐
 # │                            Jitter Settings                                │
@@ -1,55 +1,112 @@
+"""
+Snapshot live GPS positions of one transit line from Tallinn’s gps.txt feed.
+
+`read_and_filter_gps` downloads the feed, keeps only the requested transport
+type / line, swaps the feed’s flipped latitude/longitude columns, and converts
+micro‐degrees to decimal degrees.  Run as a script to save a timestamped
+Parquet snapshot under data/processed/.
+"""
+
+import numpy as np
 import pandas as pd
 import requests
 import io
-from datetime import datetime
+import os
+
+# Keep‐alive session so repeated snapshots reuse the TCP/TLS connection
+_SESSION = requests.Session()
+
+
+def _to_nullable_int(values: pd.Series, dtype: str) -> pd.Series:
+    """
+    Coerce `values` to the nullable integer `dtype` (e.g. 'Int16').  Cells that
+    are not numbers, not whole, or out of the dtype's range become <NA> instead
+    of being truncated or wrapped by the cast.
+    """
+    numbers = pd.to_numeric(values, errors='coerce')
+    bounds = np.iinfo(dtype.lower())
+    valid = (numbers % 1 == 0) & numbers.between(bounds.min, bounds.max)
+    return numbers.where(valid).astype(dtype)
 
 
 def read_and_filter_gps(url: str = "https://transport.tallinn.ee/gps.txt",
                         line_number: int = 8,
                         transport_type: int = 2) -> pd.DataFrame:
     # 1) Download the feed
-    resp = requests.get(url, headers={'User-Agent': 'Mozilla/5.0'})
+    resp = _SESSION.get(url, headers={'User-Agent': 'Mozilla/5.0'})
     resp.raise_for_status()
-    text_stream = io.StringIO(resp.text)
 
-    # 2) Column names in the order the feed provides them
-    cols = [
-        'transport_type', 'line', 'lat_micro', 'lon_micro',
-        'speed', 'heading', 'vehicle_id', 'vehicle_type',
-        'stop_sequence', 'stop_name'
-    ]
+    # 2) Column names in the order the feed provides them, with their types
+    #    (nullable ints: the feed leaves e.g. speed empty for some vehicles).
+    #    Code-like columns (route e.g. '8A', vehicle type e.g. 'Z') stay strings;
+    #    transport_type/line are coerced below so odd values just fail the filter.
+    schema = {
+        'transport_type': 'string[pyarrow]',
+        'line': 'string[pyarrow]',
+        'lat_micro': 'Int64',
+        'lon_micro': 'Int64',
+        'speed': 'Int16',
+        'heading': 'Int16',
+        'vehicle_id': 'string[pyarrow]',
+        'vehicle_type': 'string[pyarrow]',
+        'stop_sequence': 'Int16',
+        'stop_name': 'string[pyarrow]',
+    }
+    read_opts = dict(names=list(schema), header=None, dtype_backend='pyarrow', on_bad_lines='skip')
+
+    # 3) Parse straight into typed columns; if a numeric column holds a
+    #    malformed cell (text, a fraction, …), re-read as strings and coerce it
+    #    (bad cells → <NA>) rather than losing the whole snapshot
+    try:
+        dataframe = pd.read_csv(io.StringIO(resp.text), dtype=schema, **read_opts)
+    except (ValueError, TypeError):
+        dataframe = pd.read_csv(io.StringIO(resp.text), dtype='string[pyarrow]', **read_opts)
+        for col, dtype in schema.items():
+            if not dtype.startswith('string'):
+                dataframe[col] = _to_nullable_int(dataframe[col], dtype)
 
-    # 3) Read everything in as strings, then filter
-    dataframe = pd.read_csv(
-        text_stream,
-        names=cols,
-        header=None,
-        usecols=cols,
-        dtype=str,
-        low_memory=False
-    )
-
-    # 4) Keep only bus-type=2 and the desired line
-    dataframe['transport_type'] = pd.to_numeric(dataframe['transport_type'], errors='coerce')
-    dataframe['line'] = pd.to_numeric(dataframe['line'], errors='coerce')
+    # 4) Keep only bus-type=2 and the desired line, before any other work
     df = dataframe[
-        (dataframe['transport_type'] == transport_type) &
-        (dataframe['line'] == line_number)
+        (pd.to_numeric(dataframe['transport_type'], errors='coerce') == transport_type) &
+        (pd.to_numeric(dataframe['line'], errors='coerce') == line_number)
     ].copy()
+    df['transport_type'] = _to_nullable_int(df['transport_type'], 'Int8')
+    df['line'] = _to_nullable_int(df['line'], 'Int16')
 
     # 5) **Swap** lat_micro ↔ lon_micro (the feed’s columns are flipped)
     df[['lat_micro', 'lon_micro']] = df[['lon_micro', 'lat_micro']]
 
-    # 6) Convert micro-degrees to decimal degrees
-    df['latitude'] = pd.to_numeric(df['lat_micro'], errors='coerce') / 1e6
-    df['longitude'] = pd.to_numeric(df['lon_micro'], errors='coerce') / 1e6
+    # 6) Convert micro-degrees to decimal degrees (in place, float32)
+    for micro_col, deg_col in (('lat_micro', 'latitude'), ('lon_micro', 'longitude')):
+        degrees = df[micro_col].to_numpy(dtype=np.float32, na_value=np.nan)
+        np.multiply(degrees, np.float32(1e-6), out=degrees)
+        df[deg_col] = degrees
     df.drop(columns=['lat_micro', 'lon_micro'], inplace=True)
 
-    # 7) Filter and return columns
-    df['snapshot_time'] = datetime.now()
+    # 7) Numeric columns already have their smallest safe (nullable) dtypes;
+    #    low-cardinality strings become categories
+    for col in ('vehicle_id', 'vehicle_type', 'stop_name'):
+        if df[col].nunique() < 0.5 * len(df):
+            df[col] = pd.Categorical(df[col])
+
+    # 8) Filter and return columns
+    df['snapshot_time'] = pd.Timestamp.now()  # one typed datetime64 scalar, broadcast
     cols_out = [
         'transport_type', 'line', 'speed', 'heading', 'vehicle_id',
         'vehicle_type', 'stop_sequence', 'stop_name',
         'latitude', 'longitude', 'snapshot_time'
     ]
     return df[cols_out]
+
+
+if __name__ == "__main__":
+    # Snapshot time goes into the filename (it is identical for every row),
+    # so the redundant column is left out of the file.  Parquet keeps the
+    # dtypes, so loaders skip schema inference.
+    snapshot = read_and_filter_gps()
+    out_dir = os.path.join("data", "processed")
+    os.makedirs(out_dir, exist_ok=True)
+    ts = pd.Timestamp.now().strftime("%Y%m%dT%H%M%S")
+    out = os.path.join(out_dir, f"bus8_{ts}.parquet")
+    snapshot.drop(columns=['snapshot_time']).to_parquet(out, engine='pyarrow', compression='snappy', index=False)
+    print(f"Saved {len(snapshot)} vehicles to: {out}")
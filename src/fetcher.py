@@ -1,66 +1,93 @@
 """
 Fetch upcoming bus‐arrival datetimes for a given stop ID.
 
-Uses `requests` to call the remote API endpoint defined in API_ENDPOINT_TEMPLATE.
+Uses a pooled `requests.Session` to call the remote API endpoint defined in API_ENDPOINT_TEMPLATE.
 Filters only lines of type 'bus' and matching TARGET_BUS_LINE, then converts the
-“seconds since midnight” field into a datetime for *today*.  Only future times
-(after now) are returned, sorted ascending.
+“seconds since midnight” field into seconds since the epoch for *today*.  Only
+future times (after now) are returned, sorted ascending, as an int64 array.
+Parsed responses are memoized per stop for the current minute.
 """
 
+import functools
+import io
+import time
+
+import numpy as np
+import pandas as pd
 import requests
-from datetime import datetime, time as dt_time, timedelta
-from typing import List
+from requests.adapters import HTTPAdapter
+from datetime import datetime, time as dt_time
+from typing import Tuple
 
 from config import API_ENDPOINT_TEMPLATE, TIME_SECS_IDX, BUS_TYPE_IDX, ROUTE_NUM_IDX, TARGET_BUS_LINE
 
+# One keep‐alive session for every fetch: repeated polls (and the two stops
+# fetched in parallel by main.fetch_and_pair) reuse pooled TCP/TLS connections.
+_SESSION = requests.Session()
+_SESSION.mount("https://", HTTPAdapter(pool_connections=4, pool_maxsize=4))
+
+
+@functools.lru_cache(maxsize=16)
+def _cached_fetch(stop_id: int, bucket: int) -> Tuple[int, ...]:
+    """
+    Download and parse one stop’s arrivals (seconds since the epoch, sorted,
+    *including* already‐passed ones).  Memoized per (stop_id, minute bucket),
+    so repeated calls within the same minute skip the network entirely.
+
+    Raises requests.RequestException on HTTP errors; exceptions are not cached.
+    """
+    url = API_ENDPOINT_TEMPLATE.format(stop_id=stop_id)
+    resp = _SESSION.get(url, timeout=5)
+    resp.raise_for_status()
+
+    # Parse only the three fields we need; short lines (e.g. the “stop,<id>”
+    # line) get NaN for the missing fields and are dropped by the filters below.
+    try:
+        df = pd.read_csv(
+            io.StringIO(resp.text),
+            header=None,
+            names=["type", "route", "secs"],
+            usecols=[BUS_TYPE_IDX, ROUTE_NUM_IDX, TIME_SECS_IDX],
+            dtype="string",
+            on_bad_lines="skip",
+        )
+    except (pd.errors.EmptyDataError, pd.errors.ParserError):
+        # Empty body or malformed CSV
+        return ()
+
+    # Must be a 'bus' on the target line (e.g. '8')
+    mask = (df["type"] == "bus") & (df["route"] == TARGET_BUS_LINE)
+
+    # Parse the “seconds since midnight” field; unparsable values (e.g. the
+    # header line) become NaN and are dropped
+    secs = pd.to_numeric(df.loc[mask.fillna(False), "secs"], errors="coerce").dropna()
+
+    midnight_s = int(datetime.combine(datetime.now().date(), dt_time.min).timestamp())
+    arrivals = midnight_s + secs.to_numpy(dtype=np.int64)
+    arrivals.sort()
+    # Immutable, so the cached value cannot be modified by callers
+    return tuple(arrivals.tolist())
 
-def fetch_arrival_datetimes(stop_id: int) -> List[datetime]:
+
+def fetch_arrival_datetimes(stop_id: int) -> np.ndarray:
     """
-    Fetch upcoming arrival times (as datetime objects) for a given bus stop (stop_id).
+    Fetch upcoming arrival times (as seconds since the epoch) for a given bus stop (stop_id).
+
+    Responses are cached in‐process for the current minute (see `_cached_fetch`).
 
     Args:
         stop_id (int): The numeric ID of the stop (e.g. ZOO_STOP_ID or TOOMPARK_STOP_ID).
 
     Returns:
-        List[datetime]: A sorted list of datetime objects representing each bus’s
-                        arrival time later than the current moment. If any HTTP or
-                        parsing error occurs, returns an empty list.
+        np.ndarray: A sorted int64 array of each bus’s arrival time (seconds since
+                    the epoch) later than the current moment. If any HTTP or
+                    parsing error occurs, returns an empty array.
     """
     try:
-        url = API_ENDPOINT_TEMPLATE.format(stop_id=stop_id)
-        resp = requests.get(url, timeout=5)
-        resp.raise_for_status()
+        arrivals = np.array(_cached_fetch(stop_id, int(time.time()) // 60), dtype=np.int64)
     except requests.RequestException:
         # Network error, timeout, or non‐2xx HTTP status
-        return []
-
-    now = datetime.now()
-    midnight_today = datetime.combine(now.date(), dt_time.min)
-    future_arrivals: List[datetime] = []
-
-    for line in resp.text.strip().splitlines():
-        fields = line.split(",")
-        # Guard: ensure enough fields
-        if len(fields) <= TIME_SECS_IDX:
-            continue
-
-        # Must be a 'bus'
-        if fields[BUS_TYPE_IDX] != "bus":
-            continue
-
-        # Must match the target bus line (e.g. '8')
-        if fields[ROUTE_NUM_IDX] != TARGET_BUS_LINE:
-            continue
-
-        # Parse the “seconds since midnight” field
-        try:
-            secs = int(fields[TIME_SECS_IDX])
-        except ValueError:
-            continue
-
-        arrival_dt = midnight_today + timedelta(seconds=secs)
-        # Only keep future times (strictly greater than now)
-        if arrival_dt > now:
-            future_arrivals.append(arrival_dt)
-
-    return sorted(future_arrivals)
+        return np.empty(0, dtype=np.int64)
+
+    # Only keep future times (strictly greater than now)
+    return arrivals[arrivals > time.time()]
@@ -9,7 +9,8 @@ This file orchestrates:
        • For each departure time:
            – Simulate one sample path (walk→wait→ride→walk) and log details.
            – Run Monte Carlo to estimate P(late) ∈ [0,1].
-           – Enforce monotonic non‐decrease on P(late).
+           – Enforce monotonic non‐decrease on P(late); once it reaches 1.0,
+             fill the rest of the window with 1.0 and stop.
   4) Plotting and saving the final P(late) curve (into `results/` with a timestamp).
 
 Usage:
@@ -20,9 +21,12 @@ import argparse
 import logging
 import os
 import time
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, date, timedelta
 from typing import List, Tuple, Optional
 
+import numpy as np
+
 from simulator import Simulator
 from montecarlo import compute_lateness_probability
 from config import (
@@ -67,21 +71,24 @@ def wait_until(target_time: datetime.time) -> datetime:
 
 
 def fetch_and_pair(last_fetch: datetime,
-                   current: datetime) -> Tuple[List[Tuple[datetime, datetime]], datetime]:
+                   current: datetime) -> Tuple[np.ndarray, datetime]:
     """
     Every 5 minutes (300s), refresh bus schedules:
-      1) fetch_arrival_datetimes(ZOO_STOP_ID)  → list of zoo departures
-      2) fetch_arrival_datetimes(TOOMPARK_STOP_ID) → list of Toompark arrivals
-      3) pair_departure_and_destination(...) to build (zoo_dep, toompark_arr) pairs.
+      1) fetch_arrival_datetimes(ZOO_STOP_ID)  → int64 array of zoo departures
+      2) fetch_arrival_datetimes(TOOMPARK_STOP_ID) → int64 array of Toompark arrivals
+         (1 and 2 run concurrently)
+      3) pair_departure_and_destination(...) to build (K, 2) (zoo_dep, toompark_arr) rows.
 
     Returns (new_trips, new_last_fetch) if >= 300s since last_fetch,
-    otherwise just ([], last_fetch).
+    otherwise just (empty (0, 2) array, last_fetch).
     """
-    if (last_fetch is None) or ((current - last_fetch).seconds >= 300):
-        deps = fetch_arrival_datetimes(ZOO_STOP_ID)
-        arrs = fetch_arrival_datetimes(TOOMPARK_STOP_ID)
+    if (last_fetch is None) or ((current - last_fetch).total_seconds() >= 300):
+        with ThreadPoolExecutor(max_workers=2) as ex:
+            deps_f = ex.submit(fetch_arrival_datetimes, ZOO_STOP_ID)
+            arrs_f = ex.submit(fetch_arrival_datetimes, TOOMPARK_STOP_ID)
+            deps, arrs = deps_f.result(), arrs_f.result()
         return pair_departure_and_destination(deps, arrs), current
-    return [], last_fetch
+    return np.empty((0, 2), dtype=np.int64), last_fetch
 
 
 def simulate_curve(start: datetime, end: datetime, step: int):
@@ -101,7 +108,7 @@ def simulate_curve(start: datetime, end: datetime, step: int):
         walk_toompark_to_office=WALK_DURATION_TOOMPARK_TO_OFFICE
     )
 
-    trips: List[Tuple[datetime, datetime]] = []
+    trips: np.ndarray = np.empty((0, 2), dtype=np.int64)
     times: List[datetime] = []
     probs: List[float] = []
     last_fetch: Optional[datetime] = None
@@ -112,9 +119,9 @@ def simulate_curve(start: datetime, end: datetime, step: int):
 
     while current <= end:
         # 1) If no trips known OR attempts to catch a bus fail, refresh now
-        if not trips:
+        if len(trips) == 0:
             new_trips, last_fetch = fetch_and_pair(last_fetch, current)
-            if new_trips:
+            if len(new_trips):
                 trips = new_trips
                 logger.info("  [DATA] Refreshed bus schedule")
 
@@ -125,7 +132,7 @@ def simulate_curve(start: datetime, end: datetime, step: int):
         #    → Force a schedule refresh, then re‐draw a new sample.
         if sample["bus_dep"] < sample["walk_end"]:
             new_trips, last_fetch = fetch_and_pair(last_fetch, current)
-            if new_trips:
+            if len(new_trips):
                 trips = new_trips
                 logger.info("  [DATA] Refreshed bus schedule")
             # Re‐draw a “valid” sample
@@ -144,7 +151,7 @@ def simulate_curve(start: datetime, end: datetime, step: int):
         logger.info(f"  • Walk to station: {int(walk_dur)}s → arrive at {walk_end:%H:%M:%S}")
         logger.info(f"  • Wait at station: {int(wait_dur)}s → bus at    {bus_dep:%H:%M:%S}")
         logger.info(f"  • Ride on bus:     {int(ride_dur)}s → arrive at {bus_arr:%H:%M:%S}")
-        logger.info(f"  • Walk to meeting: {(arrival - bus_arr).seconds}s → arrive at {arrival:%H:%M:%S}")
+        logger.info(f"  • Walk to meeting: {int((arrival - bus_arr).total_seconds())}s → arrive at {arrival:%H:%M:%S}")
 
         # 5) Monte Carlo estimate of P(late)
         raw_p = compute_lateness_probability(sim, current, trips, MONTE_CARLO_ITERATIONS)
@@ -158,6 +165,17 @@ def simulate_curve(start: datetime, end: datetime, step: int):
         times.append(current)
         probs.append(p_late)
 
+        # P(late) never decreases, so once it reaches 1.0 the rest of the
+        # window is known: fill it in without simulating (or waiting).
+        if p_late >= 1.0:
+            logger.info("  [DONE] P(late) reached 1.00; filling remaining steps")
+            current += timedelta(seconds=step)
+            while current <= end:
+                times.append(current)
+                probs.append(1.0)
+                current += timedelta(seconds=step)
+            break
+
         next_target = current + timedelta(seconds=step)
         now = datetime.now()
         sleep_secs = (next_target - now).total_seconds()
@@ -1,37 +1,182 @@
 """
-Monte Carlo wrapper around Simulator.simulate_step(...) to estimate P(late).
+Vectorized Monte Carlo estimate of P(late).
 
-Given a `Simulator` instance, a departure time, and a list of matched trips,
-run MC_ITERATIONS trials.  Count how many produce `lateness > 0`.  Return
-fraction ∈ [0.0, 1.0].
+Given a `Simulator` instance, a departure time, and the matched trips array,
+replay the same journey as Simulator.simulate_step(...) for up to MC_ITERATIONS
+samples in batches: walk → first catchable bus → ride → walk, stopping once the
+confidence interval on P(late) is tight.  As in simulate_step, each sample
+draws one bus‐departure jitter, shared by every trip it considers.  Count how many samples produce
+`lateness > 0`.  Return fraction ∈ [0.0, 1.0].  Departures
+whose outcome no jitter can change (far too early / too late) return 0.0 /
+1.0 without sampling.
+
+Two interchangeable backends count the late samples:
+  - montecarlo_numba (if Numba is installed): parallel compiled kernel,
+  - otherwise a NumPy batch with array arithmetic.
+
+Simulator.simulate_step(...) stays the reference single‐sample path (used for
+logging in main.simulate_curve); this module never calls it.
 """
 
+import math
 from datetime import datetime
-from typing import List, Tuple
+from typing import Optional
+
+import numpy as np
 
 from simulator import Simulator
-from config import MONTE_CARLO_ITERATIONS
+from config import (
+    MONTE_CARLO_ITERATIONS,
+    MONTE_CARLO_BATCH_SIZE,
+    MONTE_CARLO_CI_HALF_WIDTH,
+    WALK_VARIABILITY_SECONDS,
+    BUS_DEPARTURE_JITTER_SECONDS,
+    BUS_TRAVEL_VARIABILITY_SECONDS,
+)
+
+try:
+    from montecarlo_numba import count_late as _count_late_numba
+except ImportError:  # Numba is optional
+    _count_late_numba = None
+
+
+def _count_late_numpy(departure_s: float,
+                      class_start_s: float,
+                      walk_home: float,
+                      walk_office: float,
+                      sched_dep_s: np.ndarray,
+                      sched_arr_s: np.ndarray,
+                      jitter: np.ndarray,
+                      wb: float) -> int:
+    """
+    NumPy backend: same signature and result as montecarlo_numba.count_late.
+    """
+    # 1) Pre‐drawn jitter samples (seconds), see Simulator.draw_jitter
+    walk_j, dep_j, ride_j, final_j = jitter
+
+    # 2) When Rita reaches the zoo stop (seconds since epoch).  Epoch offsets
+    #    are np.float64 so that adding the float32 jitter keeps full precision.
+    walk_end = np.float64(departure_s) + walk_home + walk_j
+
+    # 3) First catchable bus: each sample has one departure jitter, so the first
+    #    trip with sched_dep + dep_j ≥ walk_end is the first with
+    #    sched_dep ≥ walk_end − dep_j.  Past the last trip, fall back to the
+    #    last one (forcing lateness).
+    if len(sched_dep_s):
+        last = len(sched_dep_s) - 1
+
+        idx = np.searchsorted(sched_dep_s, walk_end - dep_j, side="left")
+        np.minimum(idx, last, out=idx)
+
+        bus_dep = sched_dep_s[idx] + dep_j
+        ride_dur = (sched_arr_s - sched_dep_s)[idx] + ride_j
+    else:
+        # No scheduled trips at all: same degenerate path as simulate_step
+        bus_dep = walk_end
+        ride_dur = ride_j
+
+    # 4) Ride + final walk → arrival; late iff arrival is after class start
+    arrival = bus_dep + ride_dur + (walk_office + final_j)
+    lateness = np.maximum(0.0, arrival - np.float64(class_start_s))
+    return int(np.count_nonzero(lateness > 0))
+
+
+def _deterministic_outcome(departure_s: float,
+                           class_start_s: float,
+                           walk_home: float,
+                           walk_office: float,
+                           sched_dep_s: np.ndarray,
+                           sched_arr_s: np.ndarray) -> Optional[float]:
+    """
+    Return 0.0 / 1.0 when no jitter draw can change the outcome, else None.
+
+    With every jitter at its extreme, walk_end ∈ [lo, hi] = walk_home ± W after
+    departure, and the chosen bus lies between the first trip that could still
+    be waiting at `lo` (sched_dep ≥ lo − Wb) and the first that is certainly
+    catchable at `hi` (sched_dep ≥ hi + Wb), both clamped to the last trip.
+    Arrival is sched_arr + dep/ride/final‐walk jitter + walk_office, and matched
+    sched_arr grows with sched_dep, so those two trips bound every sample.
+    """
+    w, wb, wr = WALK_VARIABILITY_SECONDS, BUS_DEPARTURE_JITTER_SECONDS, BUS_TRAVEL_VARIABILITY_SECONDS
+    lo = departure_s + walk_home - w
+    hi = departure_s + walk_home + w
+
+    if len(sched_dep_s):
+        last = len(sched_dep_s) - 1
+        k_best = min(int(np.searchsorted(sched_dep_s, lo - wb, side="left")), last)
+        k_worst = min(int(np.searchsorted(sched_dep_s, hi + wb, side="left")), last)
+        best_arrival_s = sched_arr_s[k_best] - wb - wr + walk_office - w
+        worst_arrival_s = sched_arr_s[k_worst] + wb + wr + walk_office + w
+    else:
+        # No scheduled trips at all: same degenerate path as simulate_step
+        best_arrival_s = lo - wr + walk_office - w
+        worst_arrival_s = hi + wr + walk_office + w
+
+    if worst_arrival_s <= class_start_s:
+        return 0.0
+    if best_arrival_s > class_start_s:
+        return 1.0
+    return None
+
+
+def _ci_half_width(late_count: int, total: int) -> float:
+    """
+    Half‐width of the normal‐approximation 95% CI on P(late) after `total`
+    samples; for fewer than 100 samples p is Laplace‐smoothed so that an
+    all‐0 / all‐1 start does not report a zero‐width interval.
+    """
+    if total < 100:
+        p = (late_count + 1) / (total + 2)
+    else:
+        p = late_count / total
+    return 1.96 * math.sqrt(p * (1.0 - p) / total)
 
 
 def compute_lateness_probability(sim: Simulator,
                                  departure: datetime,
-                                 trips: List[Tuple[datetime, datetime]],
+                                 trips: np.ndarray,
                                  mc_iterations: int = MONTE_CARLO_ITERATIONS) -> float:
     """
     Args:
         sim (Simulator):      A Simulator instance (holds class_start, walk times, etc.).
         departure (datetime): The departure time from home.
-        trips (List[(datetime, datetime)]):
-                              A list of (sched_dep, sched_arr) pairs, already matched by matcher.
-        mc_iterations (int):  How many Monte Carlo samples to draw.
+        trips (np.ndarray):   (K, 2) int64 array of (sched_dep, sched_arr) rows in
+                              seconds since the epoch, already matched by matcher.
+        mc_iterations (int):  Maximum number of Monte Carlo samples to draw.  Samples
+                              are drawn in batches of MONTE_CARLO_BATCH_SIZE, stopping
+                              early once the 95% CI half‐width on P(late) is below
+                              MONTE_CARLO_CI_HALF_WIDTH.
 
     Returns:
         float: The fraction of simulated trials where `lateness > 0` (i.e. Rita is late),
                clipped to [0.0, 1.0].
     """
+    # Trip times as contiguous float64 once per call, so no batch has to convert them
+    sched_dep_s = np.ascontiguousarray(trips[:, 0], dtype=np.float64)
+    sched_arr_s = np.ascontiguousarray(trips[:, 1], dtype=np.float64)
+    departure_s = departure.timestamp()
+    class_start_s = sim.class_start.timestamp()
+
+    # Skip sampling entirely when the outcome is certain either way
+    certain = _deterministic_outcome(departure_s, class_start_s, sim.walk_home, sim.walk_office,
+                                     sched_dep_s, sched_arr_s)
+    if certain is not None:
+        return certain
+
+    count_late = _count_late_numba if _count_late_numba is not None else _count_late_numpy
     late_count = 0
-    for _ in range(mc_iterations):
-        sample = sim.simulate_step(departure, trips)
-        if sample["lateness"] > 0:
-            late_count += 1
-    return late_count / mc_iterations
+    total = 0
+    while total < mc_iterations:
+        n = min(MONTE_CARLO_BATCH_SIZE, mc_iterations - total)
+        late_count += count_late(departure_s,
+                                 class_start_s,
+                                 sim.walk_home,
+                                 sim.walk_office,
+                                 sched_dep_s,
+                                 sched_arr_s,
+                                 sim.draw_jitter(n),
+                                 BUS_DEPARTURE_JITTER_SECONDS)
+        total += n
+        if _ci_half_width(late_count, total) < MONTE_CARLO_CI_HALF_WIDTH:
+            break
+    return late_count / total
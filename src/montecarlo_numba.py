@@ -0,0 +1,91 @@
+"""
+Numba‐compiled Monte Carlo kernel for P(late).
+
+Same journey as Simulator.simulate_step(...) (one bus‐departure jitter per
+sample), but the whole MC loop runs as
+native code, split across all cores with `numba.prange`.  Everything is in
+seconds since the epoch (float64), so no Python objects are touched inside
+the loop.  Jitter samples come pre‐drawn from Simulator.draw_jitter(...), so
+the kernel allocates nothing.
+
+Importing this module requires Numba; montecarlo.py falls back to its NumPy
+path when it is not installed.
+"""
+
+import numpy as np
+from numba import njit, prange
+
+
+@njit(cache=True)
+def _find_catchable_bus(walk_end_s, dep_jitter, sched_dep_s, sched_arr_s, wb):
+    """
+    Same rule as the NumPy backend: return (actual_dep_s, base_ride_s) of the
+    first trip whose jittered departure (sched_dep + dep_jitter) is ≥ walk_end_s;
+    if none qualifies, fall back to the last trip.
+
+    Trips with sched_dep < walk_end_s − wb can never qualify, so the linear
+    scan starts from the first trip at or after that bound (binary search).
+    """
+    n_trips = sched_dep_s.shape[0]
+    k = np.searchsorted(sched_dep_s, walk_end_s - wb)
+    while k < n_trips:
+        actual_dep = sched_dep_s[k] + dep_jitter
+        if actual_dep >= walk_end_s:
+            return actual_dep, sched_arr_s[k] - sched_dep_s[k]
+        k += 1
+
+    last = n_trips - 1
+    return sched_dep_s[last] + dep_jitter, sched_arr_s[last] - sched_dep_s[last]
+
+
+@njit(parallel=True, fastmath=True, cache=True)
+def _mc_kernel(departure_s, class_start_s, walk_home, walk_office,
+               sched_dep_s, sched_arr_s, jitter, wb):
+    """
+    Run one journey per column of `jitter` (rows = walk, bus departure, ride,
+    final walk) starting at `departure_s`, and return how many arrive after
+    `class_start_s`.  `sched_dep_s` / `sched_arr_s` are the matched trips as
+    float64 seconds since the epoch, sorted by departure.
+    """
+    has_trips = sched_dep_s.shape[0] > 0
+    late_count = 0
+    for i in prange(jitter.shape[1]):
+        walk_end = departure_s + walk_home + jitter[0, i]
+
+        if has_trips:
+            bus_dep, base_ride = _find_catchable_bus(walk_end, jitter[1, i], sched_dep_s, sched_arr_s, wb)
+        else:
+            # No scheduled trips at all: same degenerate path as simulate_step
+            bus_dep, base_ride = walk_end, 0.0
+
+        ride_dur = base_ride + jitter[2, i]
+        arrival = bus_dep + ride_dur + walk_office + jitter[3, i]
+        if arrival > class_start_s:
+            late_count += 1
+    return late_count
+
+
+def count_late(departure_s: float,
+               class_start_s: float,
+               walk_home: float,
+               walk_office: float,
+               sched_dep_s: np.ndarray,
+               sched_arr_s: np.ndarray,
+               jitter: np.ndarray,
+               wb: float) -> int:
+    """
+    Typed entry point for `_mc_kernel`: casts every argument to the dtype the
+    compiled signature expects, so Numba compiles (and caches) exactly once.
+    compute_lateness_probability already passes contiguous float64 trips and
+    float32 jitter, so the array casts are no‐ops (no copies per batch).
+
+    Returns:
+        int: Number of the simulated journeys (one per column of the (4, n)
+             float32 `jitter` array) with lateness > 0.
+    """
+    return int(_mc_kernel(float(departure_s), float(class_start_s),
+                          float(walk_home), float(walk_office),
+                          np.ascontiguousarray(sched_dep_s, dtype=np.float64),
+                          np.ascontiguousarray(sched_arr_s, dtype=np.float64),
+                          np.ascontiguousarray(jitter, dtype=np.float32),
+                          float(wb)))
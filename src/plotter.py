@@ -10,7 +10,7 @@ with:
 
 from dataclasses import dataclass
 from datetime import datetime
-from typing import List, Tuple
+from typing import List, Optional, Tuple
 
 import matplotlib.pyplot as plt
 import matplotlib.dates as mdates
@@ -22,11 +22,27 @@ import numpy as np
 class PlotConfig:
     style: str = "ggplot"
     figsize: Tuple[int, int] = (12, 6)
-    dpi: int = 150
+    dpi: int = 100
     y_padding: float = 0.05
     x_padding_days: float = 1e-4
 
 
+# Style currently applied to rcParams (plt.style.use reads a .mplstyle file
+# from disk, so it is only re‐applied when the requested style changes)
+_applied_style: Optional[str] = None
+
+
+def _apply_style(style: str) -> None:
+    global _applied_style
+    if style == _applied_style:
+        return
+    try:
+        plt.style.use(style)
+    except OSError:
+        return
+    _applied_style = style
+
+
 def plot_curve(departure_datetimes: List[datetime],
                lateness_probabilities: List[float],
                filename: str = "lateness_curve.png",
@@ -44,19 +60,17 @@ def plot_curve(departure_datetimes: List[datetime],
     Returns:
         (fig, ax): The Matplotlib Figure and Axes.
     """
-    # 1) Apply style if available
-    try:
-        plt.style.use(config.style)
-    except OSError:
-        pass
+    # 1) Apply style if available (once per style)
+    _apply_style(config.style)
 
-    # 2) Convert P(late) to a numpy array (dtype float)
+    # 2) Convert P(late) to a numpy array (dtype float); times go to
+    #    datetime64, which Matplotlib plots natively (no date2num pass)
     y_raw = np.array(lateness_probabilities, dtype=float)
-    x_nums = mdates.date2num(departure_datetimes)
+    x_times = np.asarray(departure_datetimes, dtype="datetime64[ms]")
 
     # 3) Create a single figure/axes
     fig, ax = plt.subplots(figsize=config.figsize, dpi=config.dpi)
-    ax.plot(x_nums, y_raw, '-o', lw=2, color='steelblue', label='P(late)')
+    ax.plot(x_times, y_raw, '-o', lw=2, color='steelblue', label='P(late)')
 
     # 4) Major ticks: AutoDateLocator chooses hour/min intervals
     ax.xaxis.set_major_locator(mdates.AutoDateLocator())
@@ -66,9 +80,10 @@ def plot_curve(departure_datetimes: List[datetime],
     ax.xaxis.set_minor_locator(mdates.MinuteLocator(interval=1))
 
     # 6) X‐limits padded slightly
+    x_pad = np.timedelta64(round(config.x_padding_days * 86_400_000), "ms")
     ax.set_xlim(
-        x_nums[0] - config.x_padding_days,
-        x_nums[-1] + config.x_padding_days
+        x_times[0] - x_pad,
+        x_times[-1] + x_pad
     )
 
     # 7) Y‐axis: [−padding, 1+padding], with MajorLocator every 0.1
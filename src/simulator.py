@@ -1,48 +1,51 @@
 import numpy as np
-from datetime import datetime, timedelta
-from typing import List, Tuple
+from datetime import datetime
+from typing import Tuple
 
 from config import (
     WALK_VARIABILITY_SECONDS,
     BUS_DEPARTURE_JITTER_SECONDS,
     BUS_TRAVEL_VARIABILITY_SECONDS,
+    MONTE_CARLO_BATCH_SIZE,
 )
 
+# Half‐widths of the four jitter sources, in the row order of Simulator.draw_jitter
+_JITTER_SCALES = np.array([WALK_VARIABILITY_SECONDS,
+                           BUS_DEPARTURE_JITTER_SECONDS,
+                           BUS_TRAVEL_VARIABILITY_SECONDS,
+                           WALK_VARIABILITY_SECONDS], dtype=np.float32)
 
-def _find_catchable_bus(arrive_zoo: datetime,
-                        trips: List[Tuple[datetime, datetime]]) -> Tuple[datetime, datetime, float]:
+
+def _find_catchable_bus(arrive_zoo_s: float,
+                        trips: np.ndarray) -> Tuple[float, float, float]:
     """
-    Among the scheduled (sched_dep, sched_arr) in `trips`, add a random
-    triangular jitter to each sched_dep. Return the first (actual_dep, sched_arr, base_ride)
-    such that actual_dep >= arrive_zoo. If none qualifies, fall back to the last trip (forcing lateness).
+    Among the scheduled (sched_dep, sched_arr) rows in `trips` (int64 seconds since
+    the epoch), draw one random triangular departure jitter for this journey and
+    return the first (actual_dep, sched_arr, base_ride) such that
+    actual_dep = sched_dep + jitter >= arrive_zoo_s. If none qualifies, fall back
+    to the last trip (forcing lateness).  This is the same model as the Monte
+    Carlo backends (montecarlo.py / montecarlo_numba.py).
 
     Returns:
-      (bus_dep_actual, scheduled_arrival, base_ride_seconds)
+      (bus_dep_actual_s, scheduled_arrival_s, base_ride_seconds)
 
-    - bus_dep_actual:  a datetime = sched_dep + jitter
-    - scheduled_arrival: the original sched_arr (datetime)
-    - base_ride_seconds: (sched_arr - sched_dep).total_seconds()
+    - bus_dep_actual_s:  sched_dep + jitter (seconds since the epoch)
+    - scheduled_arrival_s: the original sched_arr (seconds since the epoch)
+    - base_ride_seconds: sched_arr - sched_dep (seconds)
 
-    If `trips` is empty, returns (arrive_zoo, arrive_zoo, 0.0).
+    If `trips` is empty, returns (arrive_zoo_s, arrive_zoo_s, 0.0).
     """
-    if not trips:
+    if len(trips) == 0:
         # No scheduled trips at all: force lateness
-        return arrive_zoo, arrive_zoo, 0.0
-
-    # Try each scheduled departure in order:
-    for sched_dep, sched_arr in trips:
-        dep_jitter = np.random.triangular(-BUS_DEPARTURE_JITTER_SECONDS, 0, BUS_DEPARTURE_JITTER_SECONDS)
-        actual_dep = sched_dep + timedelta(seconds=dep_jitter)
-        if actual_dep >= arrive_zoo:
-            base_ride = (sched_arr - sched_dep).total_seconds()
-            return actual_dep, sched_arr, base_ride
-
-    # If no bus (after jitter) departs after arrive_zoo, pick the last one:
-    last_sched_dep, last_sched_arr = trips[-1]
+        return arrive_zoo_s, arrive_zoo_s, 0.0
+
     dep_jitter = np.random.triangular(-BUS_DEPARTURE_JITTER_SECONDS, 0, BUS_DEPARTURE_JITTER_SECONDS)
-    actual_dep = last_sched_dep + timedelta(seconds=dep_jitter)
-    base_ride = (last_sched_arr - last_sched_dep).total_seconds()
-    return actual_dep, last_sched_arr, base_ride
+
+    # First trip with sched_dep + jitter >= arrive_zoo_s, i.e. sched_dep >= arrive_zoo_s − jitter;
+    # if no bus (after jitter) departs after arrive_zoo_s, pick the last one
+    k = min(int(np.searchsorted(trips[:, 0], arrive_zoo_s - dep_jitter, side="left")), len(trips) - 1)
+    sched_dep, sched_arr = trips[k]
+    return float(sched_dep) + dep_jitter, float(sched_arr), float(sched_arr - sched_dep)
 
 
 class Simulator:
@@ -60,7 +63,37 @@ class Simulator:
         self.walk_home = walk_home_to_zoo
         self.walk_office = walk_toompark_to_office
 
-    def simulate_step(self, departure: datetime, trips: List[Tuple[datetime, datetime]]) -> dict:
+        # Reusable Monte Carlo buffers (see draw_jitter)
+        self._rng = np.random.default_rng()
+        self._alloc_jitter(MONTE_CARLO_BATCH_SIZE)
+
+    def _alloc_jitter(self, n: int) -> None:
+        # Flat storage, so any prefix reshapes to a contiguous (4, n) / (4, 2, n) slab
+        self._jitter = np.empty(4 * n, dtype=np.float32)
+        self._u = np.empty(8 * n, dtype=np.float32)
+
+    def draw_jitter(self, n: int) -> np.ndarray:
+        """
+        Fill the first `n` columns' worth of the reusable jitter buffer with fresh
+        samples of each jitter source, without allocating (the buffers only grow
+        if `n` exceeds their size).
+
+        Each symmetric triangular(−a, 0, a) draw is a·(U1 − U2), U1, U2 ~ Uniform(0, 1).
+
+        Returns:
+          A C‐contiguous (4, n) float32 view (seconds), rows = walk, bus departure,
+          ride, final walk.  It is overwritten by the next call.
+        """
+        if self._jitter.size < 4 * n:
+            self._alloc_jitter(n)
+        u = self._u[:8 * n].reshape(4, 2, n)
+        jitter = self._jitter[:4 * n].reshape(4, n)
+        self._rng.random(out=u, dtype=np.float32)
+        np.subtract(u[:, 0], u[:, 1], out=jitter)
+        jitter *= _JITTER_SCALES[:, None]
+        return jitter
+
+    def simulate_step(self, departure: datetime, trips: np.ndarray) -> dict:
         """
         1) Jitter Rita’s walk from home → zoo.
         2) Find the next catchable bus *after* she arrives (including departure jitter).
@@ -71,46 +104,49 @@ class Simulator:
         Returns a dict containing:
           "departure" : the departure time (datetime),
           "walk_end"  : when Rita arrives at the zoo stop (datetime),
-          "walk_dur"  : (walk_end - departure).seconds,
+          "walk_dur"  : (walk_end - departure) in seconds,
           "bus_dep"   : actual bus departure time,
-          "wait_dur"  : (bus_dep - walk_end).seconds,  # always ≥ 0
+          "wait_dur"  : (bus_dep - walk_end) in seconds,  # always ≥ 0
           "ride_dur"  : actual ride duration (seconds),
           "bus_arr"   : actual bus arrival at toompark (datetime),
           "arrival"   : final arrival at office (datetime),
-          "lateness"  : max(0, (arrival - class_start).seconds)
+          "lateness"  : max(0, arrival - class_start) in seconds
         """
+        # All arithmetic is in float seconds since the epoch; datetimes are
+        # only rebuilt for the returned dict.
+        dep_s = departure.timestamp()
+
         # 1) Walk to station with triangular jitter
         walk_jitter = np.random.triangular(-WALK_VARIABILITY_SECONDS, 0, WALK_VARIABILITY_SECONDS)
-        walk_end = departure + timedelta(seconds=self.walk_home + walk_jitter)
-        walk_dur = (walk_end - departure).total_seconds()
+        walk_dur = self.walk_home + walk_jitter
+        walk_end_s = dep_s + walk_dur
 
         # 2) Select next catchable bus (including departure jitter)
-        bus_dep_actual, sched_arrival, base_ride_seconds = _find_catchable_bus(walk_end, trips)
-        wait_dur = max(0.0, (bus_dep_actual - walk_end).total_seconds())
+        bus_dep_s, sched_arrival_s, base_ride_seconds = _find_catchable_bus(walk_end_s, trips)
+        wait_dur = max(0.0, bus_dep_s - walk_end_s)
 
         # 3) Jitter the ride time
         ride_jitter = np.random.triangular(-BUS_TRAVEL_VARIABILITY_SECONDS, 0, BUS_TRAVEL_VARIABILITY_SECONDS)
         ride_dur = base_ride_seconds + ride_jitter
-        bus_arrival = bus_dep_actual + timedelta(seconds=ride_dur)
+        bus_arrival_s = bus_dep_s + ride_dur
 
         # 4) Final walk with triangular jitter
         final_walk_jitter = np.random.triangular(-WALK_VARIABILITY_SECONDS,
                                                  0,
                                                  WALK_VARIABILITY_SECONDS)
-        arrival = bus_arrival + timedelta(seconds=self.walk_office + final_walk_jitter)
+        arrival_s = bus_arrival_s + self.walk_office + final_walk_jitter
 
         # 5) Compute lateness in seconds (clamped at zero)
-        lateness_td = max(timedelta(), arrival - self.class_start)
-        lateness_sec = lateness_td.total_seconds()
+        lateness_sec = max(0.0, arrival_s - self.class_start.timestamp())
 
         return {
             "departure": departure,
-            "walk_end":  walk_end,
+            "walk_end":  datetime.fromtimestamp(walk_end_s),
             "walk_dur":  walk_dur,
-            "bus_dep":   bus_dep_actual,
+            "bus_dep":   datetime.fromtimestamp(bus_dep_s),
             "wait_dur":  wait_dur,
             "ride_dur":  ride_dur,
-            "bus_arr":   bus_arrival,
-            "arrival":   arrival,
+            "bus_arr":   datetime.fromtimestamp(bus_arrival_s),
+            "arrival":   datetime.fromtimestamp(arrival_s),
             "lateness":  lateness_sec,
         }